@@ -1,279 +1,547 @@
 #!/usr/bin/env python3
 """
-Assemble the complete revised spec 002 from component files.
-"""
-
-def read_file(filepath):
-    """Read file and return contents."""
-    with open(filepath, 'r') as f:
-        return f.read()
+Assemble a spec from component files, driven by a TOML recipe.
 
-def extract_section(content, start_marker, end_marker=None):
-    """Extract a section from content between markers."""
-    lines = content.split('\n')
-    extracting = False
-    result = []
+See assembly.toml for the recipe format.
+"""
 
-    for line in lines:
-        if start_marker in line:
-            extracting = True
+import argparse
+import base64
+import hashlib
+import json
+import mmap
+import os
+import re
+import sys
+import time
+import tomllib
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+RECIPE_NAME = 'assembly.toml'
+
+# Recipe used when none is given on the command line
+DEFAULT_RECIPE = os.path.join(os.path.dirname(os.path.abspath(__file__)), RECIPE_NAME)
+
+# specs/ root searched by --all
+SPECS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Spec directories searched by --all: numbered specs plus research/
+SPEC_DIR_RE = re.compile(r'^(\d{3}-.+|research)$')
+
+# Parts emitted after a section, by its "after" key
+SEPARATORS = {
+    'blank': ('',),
+    'rule': ('', '---', ''),
+}
+
+# Pre-tokenization splits of the tiktoken vocabularies, with \p{L} spelled
+# [^\W\d_], \p{N} spelled \d and [^\s\p{L}\p{N}] spelled (?:[^\s\w]|_), since
+# re has no Unicode property classes. Pieces match tiktoken's except around
+# rare non-decimal numerals such as "²", which re counts as letters.
+PRETOKENIZE_PATTERNS = {
+    # r50k_base / p50k_base (GPT-2): contractions, letter/digit/punctuation runs
+    'gpt2': re.compile(
+        r"'(?:[sdmt]|ll|ve|re)| ?[^\W\d_]++| ?\d++| ?(?:[^\s\w]|_)++|\s++$|\s+(?!\S)|\s"
+    ),
+    # cl100k_base: digits in runs of 1-3, letter runs led by one non-letter
+    'cl100k': re.compile(
+        r"'(?i:[sdmt]|ll|ve|re)|(?:[^\r\n\w]|_)?+[^\W\d_]++|\d{1,3}+"
+        r"| ?(?:[^\s\w]|_)++[\r\n]*+|\s++$|\s*[\r\n]|\s+(?!\S)|\s"
+    ),
+}
+
+# Rank file name prefix -> split pattern; other vocabularies (e.g. o200k,
+# whose split rules need case classes) use cl100k's and count approximately
+PRETOKENIZE_BY_VOCABULARY = (
+    ('r50k', 'gpt2'),
+    ('p50k', 'gpt2'),
+    ('gpt2', 'gpt2'),
+    ('cl100k', 'cl100k'),
+)
+
+# A recipe section resolved to byte offsets in its mapped source; literal
+# "text" sections have source None and carry the text in append
+Slice = namedtuple('Slice', 'name source begin end append strip after')
+
+# Outcome of assembling one recipe. sections maps section name to tokens;
+# previous is the same mapping from the build before, or None.
+Result = namedtuple('Result', 'output parts rewritten words tokens sections previous seconds')
+
+# ATX headings we index: "## Title" and "### Title"
+HEADING_RE = re.compile(rb'^#{2,3} [^\n]*', re.MULTILINE)
+
+# Trailing spec-kit annotation such as " *(mandatory)*"
+ANNOTATION_RE = re.compile(r'\s*\*\([^)]*\)\*\s*$')
+
+
+class HeadingIndex:
+    """Byte offsets of every ##/### heading in a markdown document.
+
+    The document (bytes or a memory map) is tokenized once; lookups are
+    dict hits instead of a fresh find() scan per marker. Headings are keyed
+    both verbatim and with any trailing "*(...)*" annotation removed, so
+    '## Requirements' and '## Requirements *(mandatory)*' resolve to the
+    same offset. The first occurrence wins, matching str.find().
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.offsets = {}
+        for match in HEADING_RE.finditer(data):
+            heading = match.group().rstrip().decode('utf-8')
+            self.offsets.setdefault(heading, match.start())
+            self.offsets.setdefault(ANNOTATION_RE.sub('', heading), match.start())
+
+    def find(self, marker):
+        """Return the offset of marker, or -1 if absent (like str.find)."""
+        if marker in self.offsets:
+            return self.offsets[marker]
+        # Non-heading markers (e.g. '**Next Steps**:') and '#' markers that are
+        # not a whole ##/### heading line (e.g. '#### Notes') fall back to a scan
+        return self.data.find(marker.encode('utf-8'))
+
+
+class WordTokenizer:
+    """Heuristic token counter: ~0.75 words per token. Needs no vocabulary."""
+
+    id = 'words'
+
+    def count(self, text):
+        return round(len(text.split()) / 0.75)
+
+
+class BPETokenizer:
+    """Byte-level BPE token counter over a local rank file.
+
+    The file uses the tiktoken format: one "<base64 token> <rank>" pair per
+    line, lower ranks merging first. Text is split with the vocabulary's
+    own pre-tokenization pattern, picked by file name (PRETOKENIZE_BY_VOCABULARY),
+    so counts match tiktoken for r50k/p50k/cl100k and are approximate for
+    other vocabularies. Pre-tokenized pieces repeat heavily in prose, so
+    counts are memoized per piece.
+    """
+
+    def __init__(self, path):
+        self.ranks = {}
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    token, rank = line.split()
+                    self.ranks[base64.b64decode(token)] = int(rank)
+        name = os.path.basename(path)
+        pattern = next((p for prefix, p in PRETOKENIZE_BY_VOCABULARY if name.startswith(prefix)), 'cl100k')
+        self.pretokenize = PRETOKENIZE_PATTERNS[pattern]
+        self.id = f'bpe:{pattern}:{file_digest(path)}'
+        self._counts = {}
+
+    def _merge_count(self, piece):
+        """Apply BPE merges to piece (bytes) and return the token count."""
+        parts = [piece[i:i + 1] for i in range(len(piece))]
+        while len(parts) > 1:
+            best_rank, best_i = None, None
+            for i in range(len(parts) - 1):
+                rank = self.ranks.get(parts[i] + parts[i + 1])
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best_rank, best_i = rank, i
+            if best_i is None:
+                break
+            parts[best_i:best_i + 2] = [parts[best_i] + parts[best_i + 1]]
+        return len(parts)
+
+    def count(self, text):
+        total = 0
+        for piece in self.pretokenize.findall(text):
+            n = self._counts.get(piece)
+            if n is None:
+                n = self._counts[piece] = self._merge_count(piece.encode('utf-8'))
+            total += n
+        return total
+
+
+def make_tokenizer(spec, base_dir):
+    """Build a tokenizer from "words" or "bpe:<rank file>" (relative to base_dir)."""
+    if spec == 'words':
+        return WordTokenizer()
+    if spec.startswith('bpe:'):
+        return BPETokenizer(os.path.join(base_dir, spec[len('bpe:'):]))
+    raise ValueError(f"unknown tokenizer {spec!r} (expected 'words' or 'bpe:<rank file>')")
+
+
+def skip_lines(data, begin, end, count):
+    """Return the offset just past the first count lines of data[begin:end]."""
+    for _ in range(count):
+        newline = data.find(b'\n', begin, end)
+        if newline == -1:
+            return end
+        begin = newline + 1
+    return begin
+
+
+def limit_lines(data, begin, end, count):
+    """Return the offset ending the first count lines of data[begin:end]."""
+    pos = begin - 1
+    for _ in range(count):
+        pos = data.find(b'\n', pos + 1, end)
+        if pos == -1:
+            return end
+    return pos
+
+
+def file_digest(filepath):
+    """Return the SHA-256 hex digest of a file's bytes."""
+    with open(filepath, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+def input_digests(recipe_path, sources):
+    """Hash the recipe, its sources and this script (the assembly engine)."""
+    base_dir = os.path.dirname(recipe_path)
+    digests = {path: file_digest(os.path.join(base_dir, path)) for path in sources}
+    digests[os.path.basename(recipe_path)] = file_digest(recipe_path)
+    digests[os.path.basename(__file__)] = file_digest(__file__)
+    return digests
+
+
+def load_manifest(path):
+    """Return the previous build manifest, or None if missing or unreadable."""
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or not {'inputs', 'output', 'parts'} <= manifest.keys():
+        return None
+    return manifest
+
+
+def save_manifest(path, inputs, output, parts):
+    """Record input hashes, output hash and per-part records."""
+    with open(path, 'w') as f:
+        json.dump({'inputs': inputs, 'output': output, 'parts': parts}, f, indent=2)
+        f.write('\n')
+
+
+def map_file(filepath):
+    """Memory-map a file read-only; empty files (unmappable) become b''."""
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def close_sources(sources):
+    """Release the memory maps returned by compile_recipe()."""
+    for data in sources.values():
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+
+def load_recipe(path):
+    """Load and sanity-check an assembly recipe."""
+    with open(path, 'rb') as f:
+        recipe = tomllib.load(f)
+    for key in ('output', 'section'):
+        if key not in recipe:
+            raise ValueError(f"{path}: missing required key {key!r}")
+    for number, section in enumerate(recipe['section'], 1):
+        if ('source' in section) == ('text' in section):
+            raise ValueError(f"{path}: section {number} needs exactly one of 'source' or 'text'")
+        if section.get('after') not in (None, *SEPARATORS):
+            raise ValueError(f"{path}: section {number} has unknown after={section['after']!r}")
+    return recipe
+
+
+def recipe_sources(recipe):
+    """Return the distinct source files of a recipe, in first-use order."""
+    return list(dict.fromkeys(s['source'] for s in recipe['section'] if 'source' in s))
+
+
+def section_name(section):
+    """Label a recipe section for reports: its name, start marker or source."""
+    return section.get('name') or section.get('start') or section.get('source') or '(text)'
+
+
+def compile_recipe(recipe, base_dir):
+    """Resolve every section of a recipe to byte offsets in its source.
+
+    Each source file is memory-mapped and indexed once, however many
+    sections slice it; markers and line rules are applied to offsets, so
+    nothing is copied or decoded here. Returns (sources, slices): the
+    mapped sources by name (release with close_sources()) and one Slice
+    per section, in recipe order.
+    """
+    sources = {}
+    indexes = {}
+    try:
+        for source in recipe_sources(recipe):
+            sources[source] = map_file(os.path.join(base_dir, source))
+            indexes[source] = HeadingIndex(sources[source])
+    except OSError:
+        close_sources(sources)
+        raise
+
+    slices = []
+    for section in recipe['section']:
+        if 'text' in section:
+            slices.append(Slice(section_name(section), None, 0, 0,
+                                section['text'], False, section.get('after')))
             continue
-        if end_marker and end_marker in line:
-            break
-        if extracting:
-            result.append(line)
+        source = section['source']
+        index = indexes[source]
+        data = sources[source]
+        begin, end = 0, len(data)
+        if 'start' in section:
+            begin = index.find(section['start'])
+            if begin == -1:
+                close_sources(sources)
+                raise ValueError(f"{source}: start marker {section['start']!r} not found")
+        if 'end' in section:
+            found = index.find(section['end'])
+            # A missing end marker runs the slice to the end of the file
+            if found != -1:
+                end = found
+        if section.get('skip_lines'):
+            begin = skip_lines(data, begin, end, section['skip_lines'])
+        if 'max_lines' in section:
+            end = limit_lines(data, begin, end, section['max_lines'])
+        slices.append(Slice(
+            section_name(section), source, begin, end,
+            section.get('append', ''), section.get('strip', False),
+            section.get('after'),
+        ))
+    return sources, slices
+
+
+def iter_recipe_parts(sources, slices):
+    """Yield (section name, part) pairs of the assembled spec in output order.
+
+    Only the emitted byte range of each source is copied and decoded.
+    Parts are joined with a newline when written; nothing is accumulated
+    here so the writer can stream them straight to disk. Separators are
+    attributed to the section they follow.
+    """
+    for item in slices:
+        part = sources[item.source][item.begin:item.end].decode('utf-8') if item.source else ''
+        part += item.append
+        yield item.name, part.strip() if item.strip else part
+        for separator in SEPARATORS.get(item.after, ()):
+            yield item.name, separator
+
+
+def write_parts(parts, path, count_tokens, previous=()):
+    """Stream (section, part) pairs to path, newline-separated.
+
+    Returns one record per part: its section, content hash, word and
+    token counts, and the byte offset where it ends in the output.
+    count_tokens(digest, part) supplies token counts. Leading parts whose
+    hash matches the previous build's records are left on disk untouched;
+    the file is truncated and rewritten from the first part that differs.
+    """
+    records = []
+    f = None
+    try:
+        for i, (section, part) in enumerate(parts):
+            data = part.encode('utf-8')
+            digest = hashlib.sha256(data).hexdigest()
+            if (f is None and i < len(previous) and previous[i]['hash'] == digest
+                    and previous[i]['section'] == section):
+                records.append(previous[i])
+                continue
+            if f is None:
+                f = open(path, 'r+b' if records else 'wb')
+                f.seek(records[-1]['end'] if records else 0)
+                f.truncate()
+            if i:
+                f.write(b'\n')
+            f.write(data)
+            records.append({
+                'section': section,
+                'hash': digest,
+                'words': len(part.split()),
+                'tokens': count_tokens(digest, part),
+                'end': f.tell(),
+            })
+        if f is None and len(records) < len(previous):
+            # Unchanged prefix, but the previous build had trailing parts
+            with open(path, 'r+b') as tail:
+                tail.truncate(records[-1]['end'] if records else 0)
+    finally:
+        if f is not None:
+            f.close()
+    return records
+
+
+def section_tokens(records):
+    """Sum per-part token counts by section, in output order."""
+    totals = {}
+    for record in records:
+        totals[record['section']] = totals.get(record['section'], 0) + record['tokens']
+    return totals
+
+
+def assemble(recipe_path, force=False, tokenizer=None):
+    """Assemble one recipe, reusing its build manifest unless force is set.
+
+    Independent of the working directory: every path is resolved against
+    the recipe's directory. tokenizer overrides the recipe's "tokenizer"
+    key. Returns a Result; rewritten is 0 when the output was already up
+    to date.
+    """
+    started = time.perf_counter()
+    recipe_path = os.path.abspath(recipe_path)
+    base_dir = os.path.dirname(recipe_path)
+    recipe = load_recipe(recipe_path)
+    output_path = os.path.join(base_dir, recipe['output'])
+    manifest_path = os.path.splitext(output_path)[0] + '.manifest.json'
+    if tokenizer is None:
+        tokenizer = make_tokenizer(recipe.get('tokenizer', 'words'), base_dir)
+
+    inputs = input_digests(recipe_path, recipe_sources(recipe))
+    inputs['tokenizer'] = tokenizer.id
+    manifest = None if force else load_manifest(manifest_path)
+    if manifest and manifest['inputs'].get('tokenizer') != tokenizer.id:
+        # Cached token counts are only valid for the tokenizer that made them
+        manifest = None
+    previous = ()
+    if manifest and os.path.exists(output_path) and file_digest(output_path) == manifest['output']:
+        previous = manifest['parts']
+
+    if previous and manifest['inputs'] == inputs:
+        records = previous
+        rewritten = 0
+        previous_sections = None
+    else:
+        # Token counts memoized by part hash, seeded from the last build
+        cache = {r['hash']: r['tokens'] for r in manifest['parts']} if manifest else {}
+
+        def count_tokens(digest, part):
+            if digest not in cache:
+                cache[digest] = tokenizer.count(part)
+            return cache[digest]
+
+        sources, slices = compile_recipe(recipe, base_dir)
+        try:
+            records = write_parts(iter_recipe_parts(sources, slices), output_path,
+                                  count_tokens, previous)
+        finally:
+            close_sources(sources)
+        rewritten = len(records) - sum(1 for new, old in zip(records, previous) if new is old)
+        save_manifest(manifest_path, inputs, file_digest(output_path), records)
+        previous_sections = section_tokens(manifest['parts']) if manifest else None
+
+    return Result(
+        recipe['output'], len(records), rewritten,
+        sum(record['words'] for record in records),
+        sum(record['tokens'] for record in records),
+        section_tokens(records), previous_sections,
+        time.perf_counter() - started,
+    )
+
+
+def discover_recipes(specs_dir):
+    """Return (spec directory name, recipe path or None) for every spec directory."""
+    found = []
+    for name in sorted(os.listdir(specs_dir)):
+        path = os.path.join(specs_dir, name)
+        if os.path.isdir(path) and SPEC_DIR_RE.match(name):
+            recipe_path = os.path.join(path, RECIPE_NAME)
+            found.append((name, recipe_path if os.path.exists(recipe_path) else None))
+    return found
+
+
+def _assemble_job(job):
+    """Process-pool entry point: assemble one recipe, capturing errors."""
+    recipe_path, force, tokenizer = job
+    try:
+        return assemble(recipe_path, force, tokenizer)
+    except (OSError, ValueError) as e:
+        return e
+
+
+def assemble_all(specs_dir, force=False, jobs=None, tokenizer=None):
+    """Assemble every spec directory's recipe concurrently; print a timing report.
+
+    Results are reported in directory order regardless of which worker
+    finishes first. Returns the number of recipes that failed.
+    """
+    found = discover_recipes(specs_dir)
+    recipes = [recipe_path for _, recipe_path in found if recipe_path]
+    print(f"Assembling {len(recipes)} of {len(found)} spec directories under {specs_dir}...")
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = dict(zip(recipes, pool.map(_assemble_job, [(r, force, tokenizer) for r in recipes])))
+    elapsed = time.perf_counter() - started
+
+    width = max((len(name) for name, _ in found), default=0)
+    failures = 0
+    for name, recipe_path in found:
+        result = results.get(recipe_path)
+        if result is None:
+            print(f"  {name:<{width}}       -  no {RECIPE_NAME}")
+        elif isinstance(result, Exception):
+            failures += 1
+            print(f"  {name:<{width}}       -  ✗ {result}")
+        else:
+            status = (f"{result.rewritten} of {result.parts} parts rewritten"
+                      if result.rewritten else "up to date")
+            print(f"  {name:<{width}}  {result.seconds:6.3f}s  {result.output} "
+                  f"({status}, {result.tokens:,} tokens)")
+    print(f"Total: {elapsed:.3f}s")
+    return failures
+
+
+def print_token_report(result):
+    """Print tokens per section, with deltas against the previous build."""
+    width = max((len(name) for name in result.sections), default=0)
+    for name, tokens in result.sections.items():
+        line = f"    {name:<{width}}  {tokens:>7,}"
+        if result.previous is not None:
+            delta = tokens - result.previous.get(name, 0)
+            line += f"  ({delta:+,})" if delta else ''
+        print(line)
+    if result.previous is not None:
+        for name in result.previous.keys() - result.sections.keys():
+            print(f"    {name:<{width}}  removed ({-result.previous[name]:+,})")
 
-    return '\n'.join(result)
 
 def main():
-    print("Assembling revised spec 002...")
-
-    # Read all component files
-    overview = read_file('OVERVIEW_REVISED.md')
-    skills_arch = read_file('AGENT_SKILLS_SECTION.md')
-    skills_req = read_file('SKILLS_REQUIREMENTS.md')
-    skills_sc = read_file('SKILLS_SUCCESS_CRITERIA.md')
-    skills_clarif = read_file('SKILLS_CLARIFICATIONS.md')
-    impl_phases = read_file('IMPLEMENTATION_PHASES_REVISED.md')
-    current_spec = read_file('spec.md')
-
-    # Build the complete spec
-    spec_parts = []
-
-    # 1. Header (from current spec) - lines 1-7
-    header_lines = current_spec.split('\n')[:7]
-    spec_parts.append('\n'.join(header_lines))
-    spec_parts.append('')
-
-    # 2. Overview (revised)
-    # Remove the "# Overview Section (Revised)" header
-    overview_content = '\n'.join(overview.split('\n')[2:])
-    spec_parts.append(overview_content)
-    spec_parts.append('')
-    spec_parts.append('---')
-    spec_parts.append('')
-
-    # 3. Agent Skills Architecture (new major section)
-    spec_parts.append(skills_arch)
-    spec_parts.append('')
-    spec_parts.append('---')
-    spec_parts.append('')
-
-    # 4. User Scenarios & Testing (from current spec, lines ~19 to ~178)
-    # We'll keep this mostly as-is, just note that Skills are mentioned in scenarios
-    user_scenarios_start = current_spec.find('## User Scenarios & Testing')
-    requirements_start = current_spec.find('## Requirements *(mandatory)*')
-    user_scenarios = current_spec[user_scenarios_start:requirements_start]
-    spec_parts.append(user_scenarios.strip())
-    spec_parts.append('')
-    spec_parts.append('---')
-    spec_parts.append('')
-
-    # 5. Requirements - KEEP FR-001 to FR-060, ADD FR-061 to FR-090
-    # Extract original requirements section up to Key Entities
-    key_entities_start = current_spec.find('### Key Entities')
-    requirements = current_spec[requirements_start:key_entities_start]
-    spec_parts.append(requirements.strip())
-    spec_parts.append('')
-
-    # Add Skills requirements
-    # Remove the "# Skills Functional Requirements" header
-    skills_req_content = '\n'.join(skills_req.split('\n')[4:])
-    spec_parts.append(skills_req_content.strip())
-    spec_parts.append('')
-    spec_parts.append('---')
-    spec_parts.append('')
-
-    # 6. Key Entities (from current spec, update with Skills entity)
-    success_criteria_start = current_spec.find('## Success Criteria *(mandatory)*')
-    key_entities = current_spec[key_entities_start:success_criteria_start]
-
-    # Add Agent Skill entity
-    key_entities += '''
-
-- **Agent Skill**: Domain knowledge provider with progressive disclosure
-  - Attributes: name, description, directory structure, loading levels (1-3), allowed-tools, token budgets
-  - Relationships: Auto-activates during Commands, complements MCP, distinct from Sub-Agents, benefits both planning and execution
-
-- **Skill Level**: Progressive disclosure tier
-  - Attributes: level number (1-3), token budget, content type (metadata/core/references)
-  - Relationships: Belongs to Skill, loads sequentially based on need
-'''
-
-    spec_parts.append(key_entities.strip())
-    spec_parts.append('')
-    spec_parts.append('---')
-    spec_parts.append('')
-
-    # 7. Success Criteria - KEEP SC-001 to SC-030, ADD SC-031 to SC-045
-    non_func_start = current_spec.find('## Non-Functional Requirements')
-    success_criteria = current_spec[success_criteria_start:non_func_start]
-    spec_parts.append(success_criteria.strip())
-    spec_parts.append('')
-
-    # Add Skills success criteria
-    skills_sc_content = '\n'.join(skills_sc.split('\n')[4:])
-    spec_parts.append(skills_sc_content.strip())
-    spec_parts.append('')
-    spec_parts.append('---')
-    spec_parts.append('')
-
-    # 8-10. Non-Functional Requirements, Technology Stack, Out of Scope (unchanged)
-    out_of_scope_start = current_spec.find('## Out of Scope')
-    clarifications_start = current_spec.find('## Clarifications')
-
-    non_func_section = current_spec[non_func_start:clarifications_start]
-    spec_parts.append(non_func_section.strip())
-    spec_parts.append('')
-    spec_parts.append('---')
-    spec_parts.append('')
-
-    # 11. Clarifications - KEEP Q1-Q5, ADD Q6-Q10
-    dependencies_start = current_spec.find('## Dependencies')
-    clarifications = current_spec[clarifications_start:dependencies_start]
-    spec_parts.append(clarifications.strip())
-    spec_parts.append('')
-
-    # Add Skills clarifications
-    skills_clarif_content = '\n'.join(skills_clarif.split('\n')[4:])
-    spec_parts.append(skills_clarif_content.strip())
-    spec_parts.append('')
-    spec_parts.append('---')
-    spec_parts.append('')
-
-    # 12. Dependencies (update)
-    impl_phases_start = current_spec.find('## Implementation Phases')
-    dependencies = current_spec[dependencies_start:impl_phases_start]
-
-    # Add new dependencies
-    dependencies += '''
-
-### Research Dependencies
-- specs/research/agent-skills-integration-analysis.md (29KB)
-- specs/research/claude-code-final-architecture.md (12KB)
-- specs/research/complete-architecture-quick-reference.md (19KB)
-- specs/research/spec-revision-notes.md
-
-### Architecture Dependencies
-- specs/WORKFLOW.md - Two-process workflow architecture
-- specs/INDEX.md - Spec numbering and implementation order
-
-### Template Dependencies
-- specs/templates/spec-template.md
-- specs/templates/plan-template.md
-- specs/templates/tasks-template.md
-'''
-
-    spec_parts.append(dependencies.strip())
-    spec_parts.append('')
-    spec_parts.append('---')
-    spec_parts.append('')
-
-    # 13. Implementation Phases (completely replaced)
-    impl_content = '\n'.join(impl_phases.split('\n')[2:])
-    spec_parts.append(impl_content.strip())
-    spec_parts.append('')
-    spec_parts.append('---')
-    spec_parts.append('')
-
-    # 14. Review & Acceptance Checklist (update)
-    review_start = current_spec.find('## Review & Acceptance Checklist')
-    review_end = current_spec.find('**Next Steps**:')
-    review = current_spec[review_start:review_end]
-
-    # Add Skills-specific checks
-    review += '''
-
-### Skills Integration
-- [ ] Agent Skills architecture is comprehensive and clear
-- [ ] Progressive disclosure pattern is explained in extreme detail
-- [ ] All 8 Skills have complete directory structures defined
-- [ ] Development Skills (3) and Production Skills (5) are distinguished
-- [ ] Skills integration with Commands is well-documented
-- [ ] Skills vs MCP relationship is clarified
-- [ ] Token budgets are specified for all loading levels
-- [ ] Activation triggers are documented for each Skill
-- [ ] Skills functional requirements (FR-061 to FR-090) are complete
-- [ ] Skills success criteria (SC-031 to SC-045) are measurable
-
-### Hybrid Workflow Architecture
-- [ ] Two-process model (Spec-Kit + Claude Code) is clearly explained
-- [ ] Handoff mechanism via tasks.md is documented
-- [ ] Agentic correction loops (max 3 attempts) are specified
-- [ ] Escalation thresholds and governance are defined
-- [ ] Workflow architecture references specs/WORKFLOW.md
-- [ ] Namespaced commands (/spec:*, /workflow:*, /utils:*) are used consistently
-
-'''
-
-    spec_parts.append(review.strip())
-    spec_parts.append('')
-    spec_parts.append('---')
-    spec_parts.append('')
-
-    # 15. Next Steps (update)
-    next_steps = '''**Next Steps**:
-1. **Review this specification** - Validate hybrid workflow, Agent Skills integration, and all requirements
-2. **Approve specification** - Mark as "approved" when ready to proceed (user review required)
-3. **Create implementation branch** - Branch: `002-claude-code-commands-setup`
-4. **Begin Phase 1** - Core architecture setup (directory structure, settings.json)
-5. **Iterate through 8 phases** - Complete all phases with continuous testing and validation
-6. **Deploy to team** - Team members access via git pull
-
----
-
-**Status**: Draft - Awaiting Review (Requires user approval before implementation)
-
-**Major Revisions**:
-- Added complete Agent Skills architecture (~4000 tokens of detailed documentation)
-- Integrated hybrid workflow (Spec-Kit planning + Claude Code execution)
-- Added 30 Skills functional requirements (FR-061 to FR-090)
-- Added 15 Skills success criteria (SC-031 to SC-045)
-- Added 5 clarifications for Skills and workflow (Q6-Q10)
-- Revised implementation to 8 phases including Skills development
-- Updated command naming to namespaced format (/spec:*, /workflow:*, /utils:*)
-
-**Key Changes from Previous Version**:
-- REMOVED: "EPIC" methodology term (replaced with "hybrid workflow")
-- REMOVED: `/dash.*` separate command category (integrated into `/workflow:*`)
-- ADDED: Complete Agent Skills system (8 skills with progressive disclosure)
-- ADDED: Two-process model with clear handoff mechanism
-- ADDED: Agentic correction loops with 3-attempt limit
-
-**Review Focus Areas**:
-1. Is the Agent Skills architecture clear and comprehensive enough?
-2. Are all 8 Skills properly defined with directory structures?
-3. Is the hybrid workflow architecture well-explained?
-4. Are the 30 new functional requirements complete and testable?
-5. Are the 15 new success criteria measurable?
-6. Is the 8-phase implementation plan realistic and well-ordered?
-
----
-
-**Version**: 2.0.0 (Major revision with Agent Skills integration)
-**Last Updated**: 2025-11-10
-**Specification File**: specs/002-claude-code-commands-setup/spec.md
-'''
-
-    spec_parts.append(next_steps)
-
-    # Assemble final spec
-    final_spec = '\n'.join(spec_parts)
-
-    # Write to new file
-    with open('spec-revised.md', 'w') as f:
-        f.write(final_spec)
-
-    # Count words and estimate tokens
-    word_count = len(final_spec.split())
-    token_estimate = int(word_count / 0.75)
-
-    print(f"✓ Revised spec created: spec-revised.md")
-    print(f"  Word count: {word_count:,}")
-    print(f"  Estimated tokens: {token_estimate:,}")
-    print(f"  Increase from original: ~{token_estimate - 6500:,} tokens")
-    print()
-    print("Next step: Review spec-revised.md, then replace spec.md")
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('recipe', nargs='?', default=DEFAULT_RECIPE,
+                        help=f'assembly recipe (default: {RECIPE_NAME} next to this script)')
+    parser.add_argument('--force', action='store_true',
+                        help='ignore build manifests and rebuild everything')
+    parser.add_argument('--all', nargs='?', const=SPECS_DIR, metavar='SPECS_DIR',
+                        help='assemble every spec directory that has a recipe (default: specs/)')
+    parser.add_argument('--jobs', type=int,
+                        help='worker processes for --all (default: one per CPU)')
+    parser.add_argument('--tokenizer', metavar='SPEC',
+                        help='"words" or "bpe:<rank file>"; overrides the recipe')
+    args = parser.parse_args()
+
+    tokenizer = make_tokenizer(args.tokenizer, os.getcwd()) if args.tokenizer else None
+
+    if args.all:
+        sys.exit(1 if assemble_all(args.all, args.force, args.jobs, tokenizer) else 0)
+
+    recipe = load_recipe(args.recipe)
+    print(f"Assembling {recipe.get('title', recipe['output'])}...")
+    result = assemble(args.recipe, args.force, tokenizer)
+    if result.rewritten:
+        print(f"✓ Spec assembled: {result.output} ({result.rewritten} of {result.parts} parts rewritten)")
+    else:
+        print(f"✓ {result.output} is up to date (no inputs changed)")
+
+    print(f"  Word count: {result.words:,}")
+    print(f"  Tokens: {result.tokens:,}")
+    if result.previous is not None:
+        print(f"  Change from previous build: {result.tokens - sum(result.previous.values()):+,} tokens")
+    print_token_report(result)
+    if 'next_step' in recipe:
+        print()
+        print(f"Next step: {recipe['next_step']}")
+
 
 if __name__ == '__main__':
     main()
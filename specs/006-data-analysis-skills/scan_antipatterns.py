@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Scan Python and SQL files for the anti-patterns catalogued in spec.md.
+
+Exits 1 when any finding reaches --fail-on severity (CRITICAL by default),
+so it can run as a pre-commit hook and in /workflow:verify.
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+# Spec whose "Anti-Pattern Catalog" code block defines the rules
+DEFAULT_CATALOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'spec.md')
+
+# Per-file results from earlier runs, keyed by path
+DEFAULT_CACHE = '.antipattern-cache.json'
+
+# Bump when detection logic changes so cached findings are discarded
+SCANNER_VERSION = 1
+
+SCANNED_EXTENSIONS = ('.py', '.sql')
+SKIPPED_DIRS = {'.git', '.venv', 'venv', 'node_modules', '__pycache__', '.mypy_cache', '.pytest_cache'}
+SEVERITIES = ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL')
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+# Fenced python blocks in the catalog spec
+CODE_BLOCK_RE = re.compile(r'^```python\n(.*?)^```', re.MULTILINE | re.DOTALL)
+
+# Leading SQL keyword of a query literal
+SQL_START_RE = re.compile(r'^\s*(SELECT|INSERT|UPDATE|DELETE|WITH)\b', re.IGNORECASE)
+
+# Catalog rules that the AST pass detects precisely in Python files
+# (ignoring comments and docstrings), so their regexes skip .py files
+AST_RULES = {'iterrows_loop', 'object_dtype', 'string_concatenation'}
+
+# Tokens an AST_RULES hit needs; files without any skip the (much slower) parse
+AST_HINT_RE = re.compile(r'iterrows|dtype|[\'"]\s*(?:SELECT|INSERT|UPDATE|DELETE|WITH)\b', re.IGNORECASE)
+
+# Rules about building queries in application code; in .sql files "+" is arithmetic
+PYTHON_ONLY_RULES = {'string_concatenation'}
+
+Rule = namedtuple('Rule', 'name pattern message severity')
+Finding = namedtuple('Finding', 'path line column rule severity message')
+
+
+def load_catalog(spec_path):
+    """Read every *_ANTIPATTERNS dict from the spec's python code blocks."""
+    with open(spec_path, encoding='utf-8') as f:
+        text = f.read()
+    rules = []
+    for block in CODE_BLOCK_RE.findall(text):
+        if '_ANTIPATTERNS' not in block:
+            continue
+        for node in ast.parse(block).body:
+            if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                    and isinstance(node.targets[0], ast.Name)
+                    and node.targets[0].id.endswith('_ANTIPATTERNS')):
+                for name, rule in ast.literal_eval(node.value).items():
+                    rules.append(Rule(name, rule['pattern'], rule['message'], rule['severity']))
+    if not rules:
+        raise ValueError(f"No *_ANTIPATTERNS catalog found in {spec_path}")
+    return rules
+
+
+def catalog_digest(rules):
+    """Identify a rule set, so a changed catalog invalidates the cache."""
+    payload = json.dumps([SCANNER_VERSION, [list(rule) for rule in rules]])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def compile_rules(rules):
+    """Compile every rule into one alternation plus one regex per rule.
+
+    The alternation is a single-pass prefilter: most files match no rule
+    at all and are done after one scan. Only files it hits are rescanned
+    rule by rule, which keeps overlapping matches from being lost.
+    """
+    combined = re.compile('|'.join(f'(?:{rule.pattern})' for rule in rules))
+    return combined, [(rule, re.compile(rule.pattern)) for rule in rules]
+
+
+def line_column(text, offset):
+    line = text.count('\n', 0, offset) + 1
+    return line, offset - (text.rfind('\n', 0, offset) + 1) + 1
+
+
+def regex_findings(path, text, compiled, skip=()):
+    combined, per_rule = compiled
+    if not combined.search(text):
+        return []
+    findings = []
+    for rule, regex in per_rule:
+        if rule.name in skip:
+            continue
+        for match in regex.finditer(text):
+            line, column = line_column(text, match.start())
+            findings.append(Finding(path, line, column, rule.name, rule.severity, rule.message))
+    return findings
+
+
+def is_sql_built_from_strings(node):
+    """True for f-strings, +, % and .format() that splice values into SQL text."""
+    if isinstance(node, ast.JoinedStr):
+        parts = node.values
+        literal = ''.join(p.value for p in parts if isinstance(p, ast.Constant))
+        return any(isinstance(p, ast.FormattedValue) for p in parts) and bool(SQL_START_RE.match(literal))
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Mod)):
+        left = node.left
+        while isinstance(left, ast.BinOp) and isinstance(left.op, ast.Add):
+            left = left.left
+        return (isinstance(left, ast.Constant) and isinstance(left.value, str)
+                and bool(SQL_START_RE.match(left.value)))
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+            and node.func.attr == 'format'):
+        target = node.func.value
+        return (isinstance(target, ast.Constant) and isinstance(target.value, str)
+                and bool(SQL_START_RE.match(target.value)))
+    return False
+
+
+def ast_findings(path, tree, rules):
+    """Detect AST_RULES in a parsed module; messages come from the catalog."""
+    by_name = {rule.name: rule for rule in rules}
+    hits, nested = [], set()
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and node.func.attr == 'iterrows'):
+            hits.append(('iterrows_loop', node))
+        elif isinstance(node, ast.keyword) and node.arg == 'dtype' and (
+                (isinstance(node.value, ast.Name) and node.value.id == 'object')
+                or (isinstance(node.value, ast.Constant) and node.value.value in ('object', 'O'))):
+            hits.append(('object_dtype', node.value))
+        elif id(node) not in nested and is_sql_built_from_strings(node):
+            hits.append(('string_concatenation', node))
+            # ast.walk is breadth-first: report "a" + b + "c" once, not per operand
+            left = node
+            while isinstance(left, ast.BinOp):
+                nested.add(id(left.left))
+                left = left.left
+    findings = []
+    for name, node in hits:
+        rule = by_name.get(name)
+        if rule is not None:
+            findings.append(Finding(path, node.lineno, node.col_offset + 1,
+                                    name, rule.severity, rule.message))
+    return findings
+
+
+def scan_file(path, rules, compiled):
+    """All findings for one file, sorted by position."""
+    with open(path, encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    if path.endswith('.py'):
+        if not AST_HINT_RE.search(text):
+            return regex_findings(path, text, compiled, skip=AST_RULES)
+        try:
+            tree = ast.parse(text, filename=path)
+        except SyntaxError:
+            # Unparseable: fall back to the regexes alone
+            return regex_findings(path, text, compiled)
+        findings = ast_findings(path, tree, rules)
+        findings += regex_findings(path, text, compiled, skip=AST_RULES)
+    else:
+        findings = regex_findings(path, text, compiled, skip=PYTHON_ONLY_RULES)
+    return sorted(findings, key=lambda finding: (finding.line, finding.column, finding.rule))
+
+
+def file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+def iter_files(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if d not in SKIPPED_DIRS)
+                for name in sorted(files):
+                    if name.endswith(SCANNED_EXTENSIONS):
+                        yield os.path.normpath(os.path.join(root, name))
+        elif path.endswith(SCANNED_EXTENSIONS) and os.path.isfile(path):
+            yield os.path.normpath(path)
+
+
+def load_cache(path, digest):
+    """Cached entries, or an empty cache if the catalog or scanner changed."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache.get('files', {}) if cache.get('catalog') == digest else {}
+
+
+def save_cache(path, digest, files):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'catalog': digest, 'files': files}, f, separators=(',', ':'))
+
+
+_worker_rules = None
+
+
+def _init_worker(rules):
+    global _worker_rules
+    _worker_rules = (rules, compile_rules(rules))
+
+
+def _scan_job(path):
+    return path, scan_file(path, *_worker_rules)
+
+
+def scan(paths, rules, cache_path=None, jobs=None):
+    """Scan files under paths, reusing cached findings for unchanged files.
+
+    A file is unchanged if its mtime and size match the cache; if only the
+    mtime moved, its content hash decides. Returns (findings, scanned, total).
+    """
+    digest = catalog_digest(rules)
+    cached = load_cache(cache_path, digest) if cache_path else {}
+    entries, stale, touched = {}, [], False
+    for path in iter_files(paths):
+        stat = os.stat(path)
+        entry = cached.get(path)
+        if entry and (entry['mtime'], entry['size']) == (stat.st_mtime_ns, stat.st_size):
+            entries[path] = entry
+            continue
+        if entry and entry['size'] == stat.st_size and entry['sha256'] == file_digest(path):
+            # Touched but unchanged (checkout, rebase): keep findings, record new mtime
+            entries[path] = dict(entry, mtime=stat.st_mtime_ns)
+            touched = True
+            continue
+        stale.append((path, stat))
+
+    if len(stale) >= PARALLEL_MIN_FILES and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(rules,)) as pool:
+            results = dict(pool.map(_scan_job, [path for path, _ in stale], chunksize=16))
+    else:
+        compiled = compile_rules(rules)
+        results = {path: scan_file(path, rules, compiled) for path, _ in stale}
+    for path, stat in stale:
+        entries[path] = {'mtime': stat.st_mtime_ns, 'size': stat.st_size,
+                         'sha256': file_digest(path), 'findings': [list(f) for f in results[path]]}
+
+    if cache_path and (stale or touched):
+        # Keep entries for files outside this run's paths (e.g. pre-commit's staged subset)
+        kept = {path: entry for path, entry in cached.items()
+                if path not in entries and os.path.exists(path)}
+        save_cache(cache_path, digest, {**kept, **entries})
+    findings = [Finding(*finding) for path in sorted(entries) for finding in entries[path]['findings']]
+    return findings, len(stale), len(entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('paths', nargs='*', default=['.'],
+                        help='files or directories to scan (default: current directory)')
+    parser.add_argument('--catalog', default=DEFAULT_CATALOG,
+                        help='markdown file defining *_ANTIPATTERNS (default: spec.md next to this script)')
+    parser.add_argument('--cache', default=DEFAULT_CACHE,
+                        help=f'findings cache file (default: {DEFAULT_CACHE})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='rescan every file and leave the cache untouched')
+    parser.add_argument('--jobs', type=int,
+                        help='worker processes for large scans (default: one per CPU)')
+    parser.add_argument('--fail-on', choices=SEVERITIES, default='CRITICAL',
+                        help='lowest severity that makes the scan fail (default: CRITICAL)')
+    args = parser.parse_args()
+
+    rules = load_catalog(args.catalog)
+    findings, scanned, total = scan(args.paths, rules, None if args.no_cache else args.cache, args.jobs)
+    for finding in findings:
+        print(f'{finding.path}:{finding.line}:{finding.column}: '
+              f'{finding.severity} {finding.rule}: {finding.message}')
+
+    threshold = SEVERITIES.index(args.fail_on)
+    failing = sum(1 for finding in findings if SEVERITIES.index(finding.severity) >= threshold)
+    print(f'{len(findings)} finding(s) in {total} file(s) ({scanned} rescanned); '
+          f'{failing} at {args.fail_on} or above', file=sys.stderr)
+    sys.exit(1 if failing else 0)
+
+
+if __name__ == '__main__':
+    main()
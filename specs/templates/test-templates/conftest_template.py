@@ -7,19 +7,85 @@ and test utilities to achieve 95%+ coverage while avoiding anti-patterns.
 Place this file in your tests/ directory or subdirectories.
 """
 
+import json
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any, Callable, Generator
 from unittest.mock import Mock
 
+import numpy as np
 import pandas as pd
+import plotly.io as pio
 import pytest
 from dash import Dash
 
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # Optional: without pyarrow datasets are cached in memory only
+    pa = None
+
 
 # ============================================================================
 # PYTEST CONFIGURATION
 # ============================================================================
 
+# Default size of the large_dataframe fixture (override with --large-rows)
+LARGE_DATAFRAME_ROWS = 100_000
+
+# Date steps build_sales_dataframe tries, coarsest first, to stay within the
+# pandas Timestamp range
+SALES_FREQUENCIES = ("h", "min", "s")
+
+# Bump when a dataset builder changes so stale on-disk datasets are rebuilt
+DATASET_SCHEMA_VERSION = 1
+
+# Benchmark protocol: untimed warmup calls, then timed rounds
+BENCHMARK_WARMUP_RUNS = 2
+BENCHMARK_ROUNDS = 20
+
+# A regression needs a median slowdown above this fraction of the baseline...
+BENCHMARK_REGRESSION_TOLERANCE = 0.10
+
+# ...that is also significant: one-sided Mann-Whitney z (~p < 0.01)
+BENCHMARK_SIGNIFICANCE_Z = 2.33
+
+# ...and larger than this many seconds: millisecond timings jitter by tens of
+# percent between runs
+BENCHMARK_MIN_REGRESSION_SECONDS = 0.005
+
+# Row counts figure_benchmark builds each chart at (spans the WebGL/density cut-overs)
+FIGURE_BENCHMARK_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+
+def pytest_addoption(parser: Any) -> None:
+    """Register command-line options for fixture sizing.
+
+    Args:
+        parser: pytest command-line parser
+    """
+    parser.addoption(
+        "--large-rows",
+        type=int,
+        default=LARGE_DATAFRAME_ROWS,
+        help="number of rows in the large_dataframe fixture",
+    )
+    parser.addoption(
+        "--benchmark-baselines",
+        type=Path,
+        default=None,
+        help="JSON file of benchmark baselines (default: the pytest cache)",
+    )
+    parser.addoption(
+        "--benchmark-update",
+        action="store_true",
+        help="overwrite stored benchmark baselines with this run's timings",
+    )
+
 
 def pytest_configure(config: Any) -> None:
     """Configure pytest with custom markers and settings.
@@ -75,23 +141,118 @@ def dash_duo(dash_thread_server: Any) -> Any:
 # ============================================================================
 
 
-@pytest.fixture
-def sample_dataframe() -> pd.DataFrame:
-    """Provide sample DataFrame for testing.
+def build_sales_dataframe(
+    num_rows: int, start: str = "2020-01-01", freq: str | None = None
+) -> pd.DataFrame:
+    """Build a date/region/sales/units DataFrame with vectorized NumPy columns.
+
+    Columns are built from np.arange in one pass each and region is a
+    categorical, so construction stays fast and compact at 10M+ rows.
+    By default dates are hourly; past ~2M rows that would run beyond the
+    pandas Timestamp range (year 2262), so the coarsest of
+    SALES_FREQUENCIES that fits is used instead.
+
+    Args:
+        num_rows: Number of rows to generate
+        start: First timestamp of the date column
+        freq: pandas frequency alias between consecutive dates (default: auto)
+
+    Returns:
+        pandas DataFrame with the standard sales schema
+    """
+    if freq is None:
+        room = pd.Timestamp.max - pd.Timestamp(start)
+        freq = next(
+            (
+                f
+                for f in SALES_FREQUENCIES
+                if room // pd.Timedelta(1, unit=f) >= num_rows
+            ),
+            SALES_FREQUENCIES[-1],
+        )
+    index = np.arange(num_rows)
+    region_codes = (index % len(VALID_REGIONS)).astype(np.int8)
+    # Columns are freshly built, so let the DataFrame adopt them without copying
+    return pd.DataFrame(
+        {
+            "date": pd.date_range(start, periods=num_rows, freq=freq),
+            "region": pd.Categorical.from_codes(region_codes, categories=VALID_REGIONS),
+            "sales": 1000 + index * 0.1,
+            "units": 50 + index * 0.01,
+        },
+        copy=False,
+    )
+
+
+_session_datasets: dict[str, pd.DataFrame] = {}
+_session_tables: dict[str, Any] = {}
+
+
+def load_cached_dataset(
+    config: Any, key: str, build: Callable[[], pd.DataFrame]
+) -> pd.DataFrame:
+    """Return a synthetic dataset, building it at most once per cache key.
+
+    With pyarrow installed, datasets persist across runs as uncompressed
+    Arrow IPC files in the pytest cache directory and are memory-mapped
+    back, so numeric and date columns are zero-copy, read-only views.
+    Without pyarrow (or with the cache provider disabled) the dataset is
+    built once per session and each caller gets a copy. Either way every
+    call returns a new DataFrame, so tests stay isolated from each other.
+
+    Args:
+        config: pytest configuration object (provides the cache directory)
+        key: Unique name for the dataset's schema, size and parameters
+        build: Zero-argument function that builds the dataset
+
+    Returns:
+        pandas DataFrame; with pyarrow, existing columns are read-only
+    """
+    key = f"{key}-v{DATASET_SCHEMA_VERSION}"
+    if pa is None or getattr(config, "cache", None) is None:
+        if key not in _session_datasets:
+            _session_datasets[key] = build()
+        return _session_datasets[key].copy()
+
+    if key not in _session_tables:
+        path = config.cache.mkdir("datasets") / f"{key}.arrow"
+        if not path.exists():
+            tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+            feather.write_feather(build(), tmp_path, compression="uncompressed")
+            os.replace(tmp_path, path)
+        _session_tables[key] = feather.read_table(path, memory_map=True)
+    # A new frame per call, still zero-copy over the mapping
+    return _session_tables[key].to_pandas(split_blocks=True)
+
+
+def build_sample_dataframe() -> pd.DataFrame:
+    """Build the 100-row daily sales DataFrame behind sample fixtures.
 
     Returns:
         Sample pandas DataFrame with realistic test data
     """
+    num_rows = 100
+    index = np.arange(num_rows)
     return pd.DataFrame(
         {
-            "date": pd.date_range("2024-01-01", periods=100, freq="D"),
-            "region": ["North", "South", "East", "West"] * 25,
-            "sales": [1000 + i * 10 for i in range(100)],
-            "units": [50 + i for i in range(100)],
+            "date": pd.date_range("2024-01-01", periods=num_rows, freq="D"),
+            "region": np.tile(VALID_REGIONS, num_rows // len(VALID_REGIONS)),
+            "sales": 1000 + index * 10,
+            "units": 50 + index,
         }
     )
 
 
+@pytest.fixture
+def sample_dataframe() -> pd.DataFrame:
+    """Provide sample DataFrame for testing.
+
+    Returns:
+        Sample pandas DataFrame with realistic test data
+    """
+    return build_sample_dataframe()
+
+
 @pytest.fixture
 def empty_dataframe() -> pd.DataFrame:
     """Provide empty DataFrame for edge case testing.
@@ -103,20 +264,23 @@ def empty_dataframe() -> pd.DataFrame:
 
 
 @pytest.fixture
-def large_dataframe() -> pd.DataFrame:
+def large_dataframe(request: pytest.FixtureRequest) -> pd.DataFrame:
     """Provide large DataFrame for performance testing.
 
+    Built once per session (and cached on disk across sessions when
+    pyarrow is installed) rather than per test; each test gets its own
+    DataFrame. Columns may be read-only views: adding columns is fine,
+    but call .copy() before writing into existing ones.
+
+    Args:
+        request: pytest request, used to read the --large-rows option
+
     Returns:
-        Large pandas DataFrame (100K rows) for performance tests
+        Large pandas DataFrame (100K rows by default) for performance tests
     """
-    num_rows = 100_000
-    return pd.DataFrame(
-        {
-            "date": pd.date_range("2020-01-01", periods=num_rows, freq="H"),
-            "region": ["North", "South", "East", "West"] * (num_rows // 4),
-            "sales": [1000 + i * 0.1 for i in range(num_rows)],
-            "units": [50 + i * 0.01 for i in range(num_rows)],
-        }
+    num_rows = request.config.getoption("--large-rows")
+    return load_cached_dataset(
+        request.config, f"sales-{num_rows}", lambda: build_sales_dataframe(num_rows)
     )
 
 
@@ -173,19 +337,20 @@ def test_data_dir(tmp_path: Path) -> Path:
     return data_dir
 
 
-@pytest.fixture
-def sample_csv_file(test_data_dir: Path, sample_dataframe: pd.DataFrame) -> Path:
+@pytest.fixture(scope="session")
+def sample_csv_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create sample CSV file for testing.
 
+    Written once per session; treat the file as read-only.
+
     Args:
-        test_data_dir: Temporary test data directory
-        sample_dataframe: Sample data to write
+        tmp_path_factory: pytest session-scoped temporary path factory
 
     Returns:
         Path to created CSV file
     """
-    csv_path = test_data_dir / "sample_data.csv"
-    sample_dataframe.to_csv(csv_path, index=False)
+    csv_path = tmp_path_factory.mktemp("test_data") / "sample_data.csv"
+    build_sample_dataframe().to_csv(csv_path, index=False)
     return csv_path
 
 
@@ -242,6 +407,41 @@ def mock_database_connection() -> Mock:
     return mock_conn
 
 
+@pytest.fixture
+def local_database(
+    large_dataframe: pd.DataFrame,
+) -> Generator[Callable[[], Any], None, None]:
+    """Provide an in-process DuckDB stand-in for the PostgreSQL data source.
+
+    The in-memory database holds large_dataframe in a "sales" table and is
+    reached through DuckDB's ADBC driver, which exposes the same DB-API
+    (fetch_arrow_table(), $1-style placeholders) as ADBC PostgreSQL, so
+    pooled data sources run offline unchanged. Every connection shares the
+    one database and autocommits, so writes are visible to all of them.
+    Skips the test when the ADBC driver manager is not installed.
+
+    Args:
+        large_dataframe: Sales rows to load into the table
+
+    Yields:
+        Zero-argument function opening a new connection
+    """
+    dbapi = pytest.importorskip("adbc_driver_duckdb.dbapi")
+    database = dbapi.connect(autocommit=True)
+    with database.cursor() as cursor:
+        cursor.adbc_ingest(
+            "sales", pa.Table.from_pandas(large_dataframe, preserve_index=False)
+        )
+
+    def connect() -> Any:
+        connection = database.adbc_clone()
+        connection.adbc_connection.set_autocommit(True)  # Clones start transactional
+        return connection
+
+    yield connect
+    database.close()
+
+
 @pytest.fixture
 def mock_api_response() -> dict[str, Any]:
     """Provide mock API response for testing.
@@ -274,6 +474,83 @@ def mock_failed_api_response() -> dict[str, Any]:
     }
 
 
+class _LocalAPIHandler(BaseHTTPRequestHandler):
+    """Serve the LocalAPIServer's JSON body, failing on request."""
+
+    protocol_version = "HTTP/1.1"  # Keep connections alive between requests
+    disable_nagle_algorithm = True  # Headers and body go out as separate writes
+    server: "LocalAPIServer"
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self) -> None:
+        with self.server.lock:
+            self.server.requests += 1
+            failing = self.server.fail_next > 0
+            if failing:
+                self.server.fail_next -= 1
+        time.sleep(self.server.latency)
+        status, payload = (
+            (503, b'{"status": "error"}') if failing else (200, self.server.body)
+        )
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self) -> None:
+        # Read the body so the kept-alive connection stays in sync
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.do_GET()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass  # Keep test output clean
+
+
+class LocalAPIServer(ThreadingHTTPServer):
+    """Local JSON API that counts its traffic, for fetch-client tests."""
+
+    daemon_threads = True
+
+    def __init__(self, body: bytes) -> None:
+        super().__init__(("127.0.0.1", 0), _LocalAPIHandler)
+        self.body = body
+        self.lock = threading.Lock()
+        self.latency = 0.0  # Seconds before each response
+        self.fail_next = 0  # Requests still to answer with 503
+        self.requests = 0
+        self.connections = 0
+        self.base_url = f"http://127.0.0.1:{self.server_port}"
+
+
+@pytest.fixture
+def local_api_server(
+    mock_api_response: dict[str, Any],
+) -> Generator[LocalAPIServer, None, None]:
+    """Provide a local HTTP/1.1 JSON API for fetch-client tests.
+
+    Every GET or POST answers mock_api_response after server.latency seconds.
+    Set server.fail_next to answer that many requests with 503 first.
+    server.requests and server.connections count requests and TCP
+    connections, so tests can check coalescing and keep-alive reuse.
+
+    Args:
+        mock_api_response: JSON body served on success
+
+    Yields:
+        Running LocalAPIServer; requests go to server.base_url
+    """
+    server = LocalAPIServer(json.dumps(mock_api_response).encode())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
 # ============================================================================
 # COMPONENT FIXTURES
 # ============================================================================
@@ -334,6 +611,153 @@ def performance_thresholds() -> dict[str, float]:
     }
 
 
+def mann_whitney_z(baseline: list[float], current: list[float]) -> float:
+    """One-sided Mann-Whitney U statistic as a z-score (normal approximation).
+
+    Args:
+        baseline: Timing samples from the stored baseline
+        current: Timing samples from this run
+
+    Returns:
+        z-score; large positive values mean current is slower than baseline
+    """
+    n1, n2 = len(baseline), len(current)
+    ranked = sorted([(t, 0) for t in baseline] + [(t, 1) for t in current])
+    rank_sum = 0.0
+    i = 0
+    while i < len(ranked):
+        # Tied timings share the average of their ranks
+        j = i
+        while j < len(ranked) and ranked[j][0] == ranked[i][0]:
+            j += 1
+        rank_sum += sum(1 for _, group in ranked[i:j] if group == 1) * (i + j + 1) / 2
+        i = j
+    u = rank_sum - n2 * (n2 + 1) / 2
+    sigma = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+    return (u - n1 * n2 / 2) / sigma if sigma else 0.0
+
+
+def _load_baselines(config: Any) -> dict[str, Any]:
+    """Read stored benchmark baselines (from file or the pytest cache)."""
+    path = config.getoption("--benchmark-baselines")
+    if path is None:
+        cache = getattr(config, "cache", None)
+        return cache.get("benchmarks/baselines", {}) if cache is not None else {}
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def _save_baselines(config: Any, baselines: dict[str, Any]) -> None:
+    """Write benchmark baselines back (to file or the pytest cache)."""
+    path = config.getoption("--benchmark-baselines")
+    if path is None:
+        if getattr(config, "cache", None) is not None:
+            config.cache.set("benchmarks/baselines", baselines)
+    else:
+        path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+
+
+@pytest.fixture
+def benchmark(
+    request: pytest.FixtureRequest, performance_thresholds: dict[str, float]
+) -> Callable[..., dict[str, float]]:
+    """Provide a benchmark runner that enforces performance_thresholds.
+
+    Use it in tests marked slow or integration. The runner calls func
+    BENCHMARK_WARMUP_RUNS times untimed, then BENCHMARK_ROUNDS times timed,
+    and fails the test when:
+    - p95 exceeds performance_thresholds[budget] (SC-009: p95 < 1s), or
+    - the median is more than BENCHMARK_REGRESSION_TOLERANCE (and at least
+      BENCHMARK_MIN_REGRESSION_SECONDS) slower than the stored baseline and
+      the slowdown is statistically significant.
+
+    The first run of a benchmark (or any run with --benchmark-update)
+    stores its samples as the baseline. Pass a label to keep separate
+    baselines for several measurements in one test.
+
+    Args:
+        request: pytest request, used for the test ID and options
+        performance_thresholds: Budgets in seconds, keyed by name
+
+    Returns:
+        Function run(budget, func, label=None) returning
+        {"p50": ..., "p95": ...} seconds
+    """
+
+    def run(
+        budget: str, func: Callable[[], Any], label: str | None = None
+    ) -> dict[str, float]:
+        limit = performance_thresholds[budget]
+        for _ in range(BENCHMARK_WARMUP_RUNS):
+            func()
+        samples = []
+        for _ in range(BENCHMARK_ROUNDS):
+            start = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - start)
+        p50, p95 = (float(p) for p in np.percentile(samples, [50, 95]))
+
+        config = request.config
+        key = f"{request.node.nodeid}::{label or budget}"
+        baselines = _load_baselines(config)
+        # --benchmark-update re-baselines instead of comparing against the old samples
+        baseline = (
+            None if config.getoption("--benchmark-update") else baselines.get(key)
+        )
+        if baseline is None:
+            baselines[key] = {"p50": p50, "p95": p95, "samples": samples}
+            _save_baselines(config, baselines)
+
+        assert p95 <= limit, f"{budget}: p95 {p95:.3f}s exceeds budget {limit:.3f}s"
+        if baseline is not None and p50 - baseline["p50"] > max(
+            baseline["p50"] * BENCHMARK_REGRESSION_TOLERANCE,
+            BENCHMARK_MIN_REGRESSION_SECONDS,
+        ):
+            z = mann_whitney_z(baseline["samples"], samples)
+            assert z < BENCHMARK_SIGNIFICANCE_Z, (
+                f"{budget}: median {p50:.4f}s regressed from baseline "
+                f"{baseline['p50']:.4f}s (z={z:.2f})"
+            )
+        return {"p50": p50, "p95": p95}
+
+    return run
+
+
+@pytest.fixture
+def figure_benchmark(
+    benchmark: Callable[..., dict[str, float]],
+) -> Callable[..., dict[int, dict[str, float]]]:
+    """Provide a runner that measures a chart factory across data sizes.
+
+    For each size the factory is called on build_sales_dataframe(size) under
+    the "callback_execution" budget, and the resulting figure's JSON payload
+    is measured. Each size keeps its own regression baseline.
+
+    Args:
+        benchmark: Benchmark runner from the benchmark fixture
+
+    Returns:
+        Function run(factory, sizes=FIGURE_BENCHMARK_SIZES) returning
+        {size: {"p50": seconds, "p95": seconds, "bytes": payload size}}
+    """
+
+    def run(
+        factory: Callable[[pd.DataFrame], Any],
+        sizes: tuple[int, ...] = FIGURE_BENCHMARK_SIZES,
+    ) -> dict[int, dict[str, float]]:
+        results = {}
+        for num_rows in sizes:
+            df = build_sales_dataframe(num_rows)
+            timings = benchmark(
+                "callback_execution",
+                lambda df=df: factory(df),
+                label=f"figure_build[{num_rows}]",
+            )
+            results[num_rows] = {**timings, "bytes": len(pio.to_json(factory(df)))}
+        return results
+
+    return run
+
+
 # ============================================================================
 # VALIDATION FIXTURES
 # ============================================================================
@@ -458,7 +882,7 @@ This conftest.py prevents common LLM anti-patterns:
    - Helper functions with clear docstrings
 
 ✅ PREVENTS: No performance testing support
-   - Performance threshold fixtures included
+   - Performance threshold fixtures and a benchmark runner that enforces them
 
 ✅ PREVENTS: No accessibility testing support
    - WCAG 2.1 AA configuration fixtures